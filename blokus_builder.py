@@ -10,14 +10,18 @@ bl_info = {
 
 import bpy
 import bmesh
+import functools
 import math
 import os
+import struct
+import numpy as np
 from bpy.props import (
     FloatProperty, IntProperty, StringProperty,
     BoolProperty, EnumProperty, PointerProperty,
 )
 from bpy.types import PropertyGroup, Panel, Operator
-from collections import defaultdict, deque
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ---------------------------------------------------------------------------
 # 4. Piece Definitions (21 standard Blokus shapes)
@@ -54,10 +58,64 @@ PIECES = {
 
 COLORS = ["RED", "BLUE", "YELLOW", "GREEN"]
 
+
+def cells_to_bitmask(cells):
+    """Pack cells into an int bitmask. Returns (mask, row_stride).
+
+    Rows are one bit wider than the shape, so the spare column keeps
+    horizontal shifts from wrapping into the neighbouring row.
+    """
+    min_x = min(c[0] for c in cells)
+    min_y = min(c[1] for c in cells)
+    stride = max(c[0] for c in cells) - min_x + 2
+    mask = 0
+    for (cx, cy) in cells:
+        mask |= 1 << ((cy - min_y) * stride + (cx - min_x))
+    return mask, stride
+
+
+# Per-shape data derived from the cell list. x_lines / y_lines are the grid
+# lines the piece spans, including its outer boundaries; bbox is (w, h) in
+# cells and mask/stride the cells_to_bitmask packing of the footprint.
+PieceMeta = namedtuple(
+    "PieceMeta",
+    "cells min_x max_x min_y max_y x_lines y_lines bbox mask stride")
+
+
+def piece_meta(cells):
+    """Return the PieceMeta for a tuple of cells."""
+    xs = [c[0] for c in cells]
+    ys = [c[1] for c in cells]
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    mask, stride = cells_to_bitmask(cells)
+    return PieceMeta(
+        cells, min_x, max_x, min_y, max_y,
+        tuple(range(min_x, max_x + 2)),
+        tuple(range(min_y, max_y + 2)),
+        (max_x - min_x + 1, max_y - min_y + 1),
+        mask, stride,
+    )
+
+
+PIECE_META = {name: piece_meta(tuple(cells)) for name, cells in PIECES.items()}
+
 # ---------------------------------------------------------------------------
 # 4.2 Validation
 # ---------------------------------------------------------------------------
 
+def bitmask_connected(mask, stride):
+    """True if the set bits of `mask` form one 4-connected component."""
+    flood = mask & -mask  # lowest set bit
+    while True:
+        grown = (flood | (flood << 1) | (flood >> 1)
+                 | (flood << stride) | (flood >> stride)) & mask
+        if grown == flood:
+            return flood == mask
+        flood = grown
+
+
+@functools.lru_cache(maxsize=None)
 def validate_pieces():
     """Check piece data invariants. Returns (ok, messages)."""
     msgs = []
@@ -73,19 +131,8 @@ def validate_pieces():
         if len(set(cells)) != n:
             msgs.append(f"{name}: duplicate cells")
 
-        # connectivity (BFS)
-        cell_set = set(cells)
-        visited = set()
-        queue = deque([cells[0]])
-        visited.add(cells[0])
-        while queue:
-            cx, cy = queue.popleft()
-            for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                nb = (cx + dx, cy + dy)
-                if nb in cell_set and nb not in visited:
-                    visited.add(nb)
-                    queue.append(nb)
-        if visited != cell_set:
+        # connectivity (bitmask flood fill)
+        if not bitmask_connected(*cells_to_bitmask(cells)):
             msgs.append(f"{name}: not connected")
 
     if total_cells != 89:
@@ -96,7 +143,7 @@ def validate_pieces():
         if size_counts.get(sz, 0) != cnt:
             msgs.append(f"Size-{sz} count = {size_counts.get(sz, 0)}, expected {cnt}")
 
-    return (len(msgs) == 0, msgs)
+    return (len(msgs) == 0, tuple(msgs))
 
 
 def validate_params(p):
@@ -163,7 +210,6 @@ class BLK_Properties(PropertyGroup):
         ],
         default='PER_PIECE',
     )
-    apply_transforms: BoolProperty(name="Apply Transforms", default=True)
     # Colors
     color_red: BoolProperty(name="Red", default=True)
     color_blue: BoolProperty(name="Blue", default=True)
@@ -175,6 +221,10 @@ class BLK_Properties(PropertyGroup):
     # Debug
     keep_cutters: BoolProperty(name="Keep Cutters", default=False,
                                description="Keep Boolean cutter objects for debugging")
+    fast_boolean: BoolProperty(name="Fast Boolean", default=False,
+                               description="Cut grooves and dowel holes with the FAST "
+                                           "solver first (faster, but may leave broken "
+                                           "cuts where parts overlap)")
     # Layout
     layout_gap: FloatProperty(name="Layout Gap", default=2.0, min=0.0, max=20.0,
                               description="Gap between pieces on plate", unit='LENGTH')
@@ -190,26 +240,59 @@ def ensure_scene_units_mm():
 
 
 def get_or_create_collection(name):
-    if name in bpy.data.collections:
-        return bpy.data.collections[name]
+    col = bpy.data.collections.get(name)
+    if col is not None:
+        return col
     col = bpy.data.collections.new(name)
     bpy.context.scene.collection.children.link(col)
     return col
 
 
-def wipe_collection(name):
-    if name not in bpy.data.collections:
-        return
-    col = bpy.data.collections[name]
-    for obj in list(col.objects):
-        bpy.data.objects.remove(obj, do_unlink=True)
-    bpy.data.collections.remove(col)
-
-
-def select_only(obj):
-    bpy.ops.object.select_all(action='DESELECT')
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
+def wipe_collections(names):
+    """Remove the named collections, their objects and meshes used only by them."""
+    ids = []
+    mesh_uses = defaultdict(int)
+    for name in names:
+        col = bpy.data.collections.get(name)
+        if col is None:
+            continue
+        for obj in col.objects:
+            ids.append(obj)
+            if obj.type == 'MESH':
+                mesh_uses[obj.data] += 1
+        ids.append(col)
+    ids.extend(mesh for mesh, uses in mesh_uses.items() if mesh.users == uses)
+    if ids:
+        bpy.data.batch_remove(ids=ids)
+
+
+def remove_with_mesh(obj):
+    """Remove a mesh object together with its (unshared) mesh datablock."""
+    mesh = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
+
+def bake_modifier(obj, mod):
+    """Apply and remove `mod`. Returns False (mesh kept) if the result has no faces."""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    try:
+        baked = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+    except RuntimeError:
+        baked = None
+    obj.modifiers.remove(mod)
+    if baked is None or not baked.polygons:
+        if baked is not None:
+            bpy.data.meshes.remove(baked)
+        return False
+
+    old = obj.data
+    obj.data = baked
+    if old.users == 0:
+        bpy.data.meshes.remove(old)
+    baked.name = obj.name
+    return True
 
 
 def link_to_collection(obj, col_name):
@@ -234,113 +317,197 @@ def enabled_colors(p):
         cols.append("GREEN")
     return cols
 
-# ---------------------------------------------------------------------------
-# 5.3.1 Piece outline: cells -> contour -> extruded mesh
-# ---------------------------------------------------------------------------
 
-def cells_to_outline(cells):
-    """Return ordered list of (x, y) vertices forming the outer contour."""
-    edge_count = defaultdict(int)
-    for (cx, cy) in cells:
-        # 4 edges of unit square at (cx, cy)
-        edges = [
-            ((cx, cy), (cx + 1, cy)),       # bottom
-            ((cx + 1, cy), (cx + 1, cy + 1)),  # right
-            ((cx, cy + 1), (cx + 1, cy + 1)),  # top
-            ((cx, cy), (cx, cy + 1)),        # left
-        ]
-        for e in edges:
-            key = tuple(sorted(e))
-            edge_count[key] += 1
-
-    # Keep only boundary edges (count == 1)
-    boundary = [e for e, c in edge_count.items() if c == 1]
-
-    # Build adjacency
-    adj = defaultdict(list)
-    for a, b in boundary:
-        adj[a].append(b)
-        adj[b].append(a)
-
-    # Walk the loop
-    if not boundary:
-        return []
-    start = boundary[0][0]
-    loop = [start]
-    visited_edges = set()
-    current = start
-    while True:
-        found_next = False
-        for nb in adj[current]:
-            edge_key = tuple(sorted((current, nb)))
-            if edge_key not in visited_edges:
-                visited_edges.add(edge_key)
-                loop.append(nb)
-                current = nb
-                found_next = True
-                break
-        if not found_next:
-            break
+def prism_geometry(outline, z_min, z_max):
+    """Vertical prism over a CCW (x, y) polygon.
 
-    # Remove last if it equals first (closed loop)
-    if len(loop) > 1 and loop[-1] == loop[0]:
-        loop.pop()
+    Returns (co, loop_total, loop_verts) as NumPy arrays: vertices 0..n-1
+    are the bottom ring, n..2n-1 the top ring; faces are bottom, top, then
+    n side quads, all wound to face outward.
+    """
+    n = len(outline)
+    co = np.empty((2 * n, 3), dtype=np.float32)
+    co[:n, :2] = outline
+    co[n:, :2] = outline
+    co[:n, 2] = z_min
+    co[n:, 2] = z_max
+
+    # The top keeps the CCW winding, the bottom is reversed, and side quad
+    # i spans edge i -> i+1
+    ring = np.arange(n, dtype=np.int32)
+    ring_next = np.roll(ring, -1)
+    sides = np.stack([ring, ring_next, ring_next + n, ring + n], axis=1)
+    loop_verts = np.concatenate([ring[::-1], ring + n, sides.ravel()])
+
+    loop_total = np.full(n + 2, 4, dtype=np.int32)
+    loop_total[:2] = n
+    return co, loop_total, loop_verts
+
+
+def box_geometry(location, scale):
+    """Axis-aligned box (unit cube scaled, then moved) as prism arrays."""
+    x, y, z = location
+    hx, hy, hz = scale[0] / 2, scale[1] / 2, scale[2] / 2
+    rect = ((x - hx, y - hy), (x + hx, y - hy), (x + hx, y + hy), (x - hx, y + hy))
+    return prism_geometry(rect, z - hz, z + hz)
+
+
+def cylinder_geometry(location, radius, depth, segments=24):
+    """Z-aligned, n-gon capped cylinder centered at location as prism arrays."""
+    x, y, z = location
+    angles = np.linspace(0.0, 2.0 * math.pi, segments, endpoint=False)
+    ring = np.stack([x + radius * np.cos(angles), y + radius * np.sin(angles)], axis=1)
+    return prism_geometry(ring, z - depth / 2, z + depth / 2)
+
+
+def merge_geometry(parts):
+    """Concatenate (co, loop_total, loop_verts) parts into one set of arrays."""
+    offsets = np.cumsum([0] + [len(co) for co, _, _ in parts[:-1]], dtype=np.int32)
+    return (
+        np.concatenate([co for co, _, _ in parts]),
+        np.concatenate([lt for _, lt, _ in parts]),
+        np.concatenate([lv + off for (_, _, lv), off in zip(parts, offsets)]),
+    )
 
-    return loop
 
+def build_mesh(name, geom):
+    """Create a mesh datablock from (co, loop_total, loop_verts) via foreach_set."""
+    co, loop_total, loop_verts = geom
+    loop_start = np.zeros(len(loop_total), dtype=np.int32)
+    np.cumsum(loop_total[:-1], out=loop_start[1:])
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.add(len(loop_total))
+    mesh.polygons.foreach_set("loop_start", loop_start)
+    if bpy.app.version < (4, 0, 0):
+        # Read-only (derived from loop_start) since 4.0
+        mesh.polygons.foreach_set("loop_total", loop_total)
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def new_mesh_object(name, geom, col_name=None):
+    """Create an object from geometry arrays, linked to col_name (default: scene)."""
+    obj = bpy.data.objects.new(name, build_mesh(name, geom))
+    if col_name is None:
+        bpy.context.scene.collection.objects.link(obj)
+    else:
+        get_or_create_collection(col_name).objects.link(obj)
+    return obj
 
-def create_piece_mesh(name, cells, cell_size, piece_t, bevel_top):
-    """Create an extruded piece mesh from cell coordinates."""
-    outline = cells_to_outline(cells)
-    if not outline:
-        return None
 
+def recalc_normals(mesh):
+    """Make face normals consistent (outward) without entering Edit mode."""
     bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
 
-    # Create bottom face vertices
-    bottom_verts = []
-    top_verts = []
-    for (gx, gy) in outline:
-        x = gx * cell_size
-        y = gy * cell_size
-        bv = bm.verts.new((x, y, 0.0))
-        tv = bm.verts.new((x, y, piece_t))
-        bottom_verts.append(bv)
-        top_verts.append(tv)
+# ---------------------------------------------------------------------------
+# 5.3.1 Piece outline: cells -> contour -> extruded mesh
+# ---------------------------------------------------------------------------
 
-    bm.verts.ensure_lookup_table()
+@functools.lru_cache(maxsize=None)
+def cells_to_outline(cells):
+    """Return ordered tuple of (x, y) vertices forming the outer contour (CCW).
+
+    `cells` must be hashable (pass a frozenset).
+    """
+    # Walk each unit square counter-clockwise. An edge shared by two cells
+    # is visited once in each direction, so reversed pairs cancel and the
+    # remaining directed edges are the boundary, already oriented.
+    edges = set()
+    for (cx, cy) in cells:
+        corners = ((cx, cy), (cx + 1, cy), (cx + 1, cy + 1), (cx, cy + 1))
+        for i in range(4):
+            a, b = corners[i], corners[(i + 1) % 4]
+            if (b, a) in edges:
+                edges.remove((b, a))
+            else:
+                edges.add((a, b))
+
+    if not edges:
+        return ()
+
+    # Each boundary vertex has exactly one outgoing edge: follow them
+    next_vert = dict(edges)
+    start = min(next_vert)
+    loop = [start]
+    current = next_vert[start]
+    while current != start and len(loop) < len(next_vert):
+        loop.append(current)
+        current = next_vert[current]
 
-    n = len(outline)
+    return tuple(loop)
 
-    # Bottom face (reversed winding for outward normal pointing down)
-    try:
-        bf = bm.faces.new(list(reversed(bottom_verts)))
-    except Exception:
-        bf = None
 
-    # Top face
-    try:
-        tf = bm.faces.new(top_verts)
-    except Exception:
-        tf = None
+# The 8 symmetries of the square grid (4 rotations, then the same mirrored),
+# as (a, b, c, d) for (x, y) -> (a*x + b*y, c*x + d*y).
+D4_TRANSFORMS = (
+    (1, 0, 0, 1), (0, -1, 1, 0), (-1, 0, 0, -1), (0, 1, -1, 0),
+    (-1, 0, 0, 1), (0, 1, 1, 0), (1, 0, 0, -1), (0, -1, -1, 0),
+)
 
-    # Side faces
-    for i in range(n):
-        j = (i + 1) % n
-        try:
-            bm.faces.new([bottom_verts[i], bottom_verts[j],
-                          top_verts[j], top_verts[i]])
-        except Exception:
-            pass
 
-    bm.normal_update()
+def canonical_form(cells):
+    """Return (key, transform, offset) for the D4-minimal form of `cells`.
+
+    `key` is the lexicographically smallest sorted cell tuple over all 8
+    rotations/reflections, shifted to min (0, 0). Vertex coordinates map
+    into that frame as v' = M v - offset, with M = `transform`.
+    """
+    best = None
+    for (a, b, c, d) in D4_TRANSFORMS:
+        # A cell is the unit square at its min corner; transform both
+        # opposite corners and take the new min corner.
+        moved = [
+            (min(a * cx + b * cy, a * (cx + 1) + b * (cy + 1)),
+             min(c * cx + d * cy, c * (cx + 1) + d * (cy + 1)))
+            for (cx, cy) in cells
+        ]
+        ox = min(m[0] for m in moved)
+        oy = min(m[1] for m in moved)
+        key = tuple(sorted((mx - ox, my - oy) for (mx, my) in moved))
+        if best is None or key < best[0]:
+            best = (key, (a, b, c, d), (ox, oy))
+    return best
+
+
+def piece_outline(cells):
+    """Outline of `cells` (CCW), traced once per D4 orbit and mapped back."""
+    key, (a, b, c, d), (ox, oy) = canonical_form(cells)
+    outline = [
+        # inverse of v' = M v - offset (M is orthogonal: inverse = transpose)
+        (a * (x + ox) + c * (y + oy), b * (x + ox) + d * (y + oy))
+        for (x, y) in cells_to_outline(frozenset(key))
+    ]
+    if a * d - b * c < 0:
+        outline.reverse()  # a reflection flips the winding
+    return outline
+
+
+def build_piece_geometry(cells, cell_size, piece_t):
+    """Build the extruded (ungrooved) piece prism arrays, or None if there is no outline."""
+    outline = piece_outline(cells)
+    if not outline:
+        return None
+    return prism_geometry(np.asarray(outline, dtype=np.float32) * cell_size,
+                          0.0, piece_t)
 
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
 
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.scene.collection.objects.link(obj)
+def create_piece_mesh(name, cells, cell_size, piece_t, bevel_top):
+    """Create an extruded piece mesh from cell coordinates."""
+    geom = build_piece_geometry(cells, cell_size, piece_t)
+    if geom is None:
+        return None
+
+    obj = new_mesh_object(name, geom)
 
     # Bevel top edges
     if bevel_top > 0:
@@ -349,8 +516,7 @@ def create_piece_mesh(name, cells, cell_size, piece_t, bevel_top):
         mod.segments = 2
         mod.limit_method = 'ANGLE'
         mod.angle_limit = math.radians(60)
-        select_only(obj)
-        bpy.ops.object.modifier_apply(modifier=mod.name)
+        bake_modifier(obj, mod)
 
     return obj
 
@@ -358,174 +524,159 @@ def create_piece_mesh(name, cells, cell_size, piece_t, bevel_top):
 # 5.3.2-3 Groove generation (Boolean)
 # ---------------------------------------------------------------------------
 
-def get_grid_lines_for_piece(cells):
-    """Return lists of X and Y grid-line indices that the piece spans (including outer edges)."""
-    xs = [c[0] for c in cells]
-    ys = [c[1] for c in cells]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-    # Grid lines at every integer boundary from min to max+1
-    x_lines = list(range(min_x, max_x + 2))  # includes outer boundaries
-    y_lines = list(range(min_y, max_y + 2))
-    return x_lines, y_lines
-
-
-def make_groove_cutter(name, cells, cell_size, groove_w, groove_d, piece_t):
-    """Create a single joined object of groove bars for Boolean subtraction."""
-    x_lines, y_lines = get_grid_lines_for_piece(cells)
-    xs = [c[0] for c in cells]
-    ys = [c[1] for c in cells]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-
-    piece_x_min = min_x * cell_size
-    piece_x_max = (max_x + 1) * cell_size
-    piece_y_min = min_y * cell_size
-    piece_y_max = (max_y + 1) * cell_size
+# Finished piece meshes by piece name, shared across colors. Only valid for
+# the duration of one Generate Pieces run (parameters may change between runs).
+_PIECE_MESH_CACHE = {}
+
+
+def occupied_runs(indices, is_occupied):
+    """Return (first, last) index pairs of the maximal runs where is_occupied(i)."""
+    runs = []
+    run_start = None
+    prev = None
+    for i in indices:
+        if is_occupied(i):
+            if run_start is None:
+                run_start = i
+            prev = i
+        elif run_start is not None:
+            runs.append((run_start, prev))
+            run_start = None
+    if run_start is not None:
+        runs.append((run_start, prev))
+    return runs
+
+
+def make_groove_cutter(name, meta, cell_size, groove_w, groove_d, piece_t):
+    """Create a single object of groove bars for Boolean subtraction.
+
+    A grid line only gets bars along the runs where it borders at least one
+    occupied cell.
+    """
+    y_range = range(meta.min_y, meta.max_y + 1)
+    x_range = range(meta.min_x, meta.max_x + 1)
+    width = meta.bbox[0]
+
+    def occupied(x, y):
+        # Bit test against the packed footprint; outside the bbox is empty
+        x -= meta.min_x
+        y -= meta.min_y
+        return (0 <= x < width and y >= 0
+                and (meta.mask >> (y * meta.stride + x)) & 1)
+
+    # Bars stick out past the open run ends and below the piece bottom, so
+    # no cutter face ends up coplanar with a piece face. Beyond a run end
+    # both neighbouring cells are empty, so the overshoot only cuts air.
+    overshoot = 0.5
+    z_center = (groove_d - overshoot) / 2
+    z_size = groove_d + overshoot
 
     bars = []
 
     # X-direction grid lines (vertical lines -> bars along Y)
-    for gx in x_lines:
-        x_center = gx * cell_size
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(
-                x_center,
-                (piece_y_min + piece_y_max) / 2,
-                groove_d / 2,
-            ),
-            scale=(
-                groove_w,
-                piece_y_max - piece_y_min + groove_w * 2,  # extend a bit
-                groove_d,
-            ),
-        )
-        bar = bpy.context.active_object
-        bar.name = f"_bar_x_{gx}"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        bars.append(bar)
+    for gx in meta.x_lines:
+        runs = occupied_runs(
+            y_range, lambda y: occupied(gx - 1, y) or occupied(gx, y))
+        for y0, y1 in runs:
+            y_min = y0 * cell_size - overshoot
+            y_max = (y1 + 1) * cell_size + overshoot
+            bars.append(box_geometry(
+                (gx * cell_size, (y_min + y_max) / 2, z_center),
+                (groove_w, y_max - y_min, z_size),
+            ))
 
     # Y-direction grid lines (horizontal lines -> bars along X)
-    for gy in y_lines:
-        y_center = gy * cell_size
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(
-                (piece_x_min + piece_x_max) / 2,
-                y_center,
-                groove_d / 2,
-            ),
-            scale=(
-                piece_x_max - piece_x_min + groove_w * 2,
-                groove_w,
-                groove_d,
-            ),
-        )
-        bar = bpy.context.active_object
-        bar.name = f"_bar_y_{gy}"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        bars.append(bar)
+    for gy in meta.y_lines:
+        runs = occupied_runs(
+            x_range, lambda x: occupied(x, gy - 1) or occupied(x, gy))
+        for x0, x1 in runs:
+            x_min = x0 * cell_size - overshoot
+            x_max = (x1 + 1) * cell_size + overshoot
+            bars.append(box_geometry(
+                ((x_min + x_max) / 2, gy * cell_size, z_center),
+                (x_max - x_min, groove_w, z_size),
+            ))
 
     if not bars:
         return None
 
-    # Join all bars into one object
-    bpy.ops.object.select_all(action='DESELECT')
-    for b in bars:
-        b.select_set(True)
-    bpy.context.view_layer.objects.active = bars[0]
-    bpy.ops.object.join()
-    cutter = bpy.context.active_object
-    cutter.name = name
-    return cutter
-
-
-def apply_boolean(target, cutter, operation='DIFFERENCE'):
-    """Apply a Boolean modifier. Returns True on success."""
-    select_only(target)
-    bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-    select_only(cutter)
-    bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-    select_only(target)
-    mod = target.modifiers.new("Bool", 'BOOLEAN')
-    mod.operation = operation
-    mod.object = cutter
-    mod.solver = 'EXACT'
-    try:
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return True
-    except Exception:
-        # Retry with FAST solver
-        target.modifiers.remove(mod)
-        mod2 = target.modifiers.new("Bool2", 'BOOLEAN')
-        mod2.operation = operation
-        mod2.object = cutter
-        mod2.solver = 'FAST'
-        try:
-            bpy.ops.object.modifier_apply(modifier=mod2.name)
+    return new_mesh_object(name, merge_geometry(bars))
+
+
+def apply_boolean(target, cutter, operation='DIFFERENCE', solver='EXACT'):
+    """Apply a Boolean modifier, falling back to the other solver. Returns True on success."""
+    for solver_try in (solver, 'FAST' if solver == 'EXACT' else 'EXACT'):
+        mod = target.modifiers.new("Bool", 'BOOLEAN')
+        mod.operation = operation
+        mod.object = cutter
+        mod.solver = solver_try
+        if bake_modifier(target, mod):
             return True
-        except Exception:
-            if mod2.name in [m.name for m in target.modifiers]:
-                target.modifiers.remove(mod2)
-            return False
+    return False
 
 
-def create_piece_with_grooves(piece_name, cells, color, p):
-    """Full pipeline: outline + grooves -> final piece object."""
+def boolean_solver(p):
+    """Preferred solver for the generated (axis-aligned) cutters."""
+    return 'FAST' if p.fast_boolean else 'EXACT'
+
+
+def build_grooved_piece(obj_name, cutter_name, meta, p):
+    """Outline + grooves -> piece object with its final mesh (not yet in a collection)."""
     cell = p.cell
     piece_t = p.piece_t
     groove_w = p.rib_w + 2 * p.clear
     groove_d = p.rib_h + 0.25
 
-    obj_name = f"BLK_P_{color}_{piece_name}"
-    col_name = f"BLK_PIECES_{color}"
-
     # 1) Create extruded piece
-    piece_obj = create_piece_mesh(obj_name, cells, cell, piece_t, p.bevel_top)
+    piece_obj = create_piece_mesh(obj_name, meta.cells, cell, piece_t, p.bevel_top)
     if piece_obj is None:
         return None
 
     # 2) Create groove cutter
-    cutter_name = f"_BLK_CUT_{color}_{piece_name}"
-    cutter = make_groove_cutter(cutter_name, cells, cell, groove_w, groove_d, piece_t)
+    cutter = make_groove_cutter(cutter_name, meta, cell, groove_w, groove_d, piece_t)
 
     if cutter is not None:
-        # 3) Trim cutter to piece footprint via INTERSECT
-        # Make a copy of the piece for intersection (we need the original intact)
-        select_only(piece_obj)
-        bpy.ops.object.duplicate(linked=False)
-        piece_copy = bpy.context.active_object
-        piece_copy.name = f"_trim_{obj_name}"
-
-        ok = apply_boolean(cutter, piece_copy, 'INTERSECT')
-        # Remove the copy
-        bpy.data.objects.remove(piece_copy, do_unlink=True)
-
-        if ok:
-            # 4) Subtract trimmed cutter from piece
-            apply_boolean(piece_obj, cutter, 'DIFFERENCE')
+        # 3) Subtract the (already footprint-clipped) cutter from piece
+        apply_boolean(piece_obj, cutter, 'DIFFERENCE', boolean_solver(p))
 
         # Cleanup cutter
         if not p.keep_cutters:
-            if cutter and cutter.name in bpy.data.objects:
-                bpy.data.objects.remove(cutter, do_unlink=True)
+            remove_with_mesh(cutter)
         else:
             link_to_collection(cutter, "BLK_TMP")
 
     # Recalculate normals
-    select_only(piece_obj)
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.normals_make_consistent(inside=False)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    recalc_normals(piece_obj.data)
+
+    return piece_obj
+
+
+def create_piece_with_grooves(piece_name, meta, color, col_name, p,
+                              location=(0.0, 0.0, 0.0)):
+    """Full pipeline: outline + grooves -> final piece object at `location`.
+
+    The mesh is built once per shape and shared across colors via
+    _PIECE_MESH_CACHE.
+    """
+    obj_name = f"BLK_P_{color}_{piece_name}"
+
+    mesh = _PIECE_MESH_CACHE.get(piece_name)
+    if mesh is not None:
+        piece_obj = bpy.data.objects.new(obj_name, mesh)
+    else:
+        cutter_name = f"_BLK_CUT_{color}_{piece_name}"
+        piece_obj = build_grooved_piece(obj_name, cutter_name, meta, p)
+        if piece_obj is None:
+            return None
+        piece_obj.data.name = f"BLK_P_{piece_name}"
+        _PIECE_MESH_CACHE[piece_name] = piece_obj.data
 
     # Store params as custom properties
-    piece_obj["blk_cell"] = cell
+    piece_obj["blk_cell"] = p.cell
     piece_obj["blk_clear"] = p.clear
     piece_obj["blk_piece_name"] = piece_name
     piece_obj["blk_color"] = color
+    piece_obj.location = location
 
     # Move to collection
     link_to_collection(piece_obj, col_name)
@@ -536,12 +687,34 @@ def create_piece_with_grooves(piece_name, cells, color, p):
 # 5.2 Board generation
 # ---------------------------------------------------------------------------
 
-def create_board_tile(tile_x, tile_y, p):
-    """Generate one board tile with base plate, grid ribs, and frame portion."""
-    cell = p.cell
+# Board parameters as plain values, read once per Generate Board run
+BoardDims = namedtuple(
+    "BoardDims",
+    "cell board_t rib_w rib_h frame_w split_x split_y "
+    "cells_per_tile_x cells_per_tile_y dowel_d dowel_len dowel_clear solver",
+)
+
+
+def board_dims(p):
+    """Snapshot the board parameters of `p` into a BoardDims."""
     grid = 20
-    cells_per_tile_x = grid // p.split_x
-    cells_per_tile_y = grid // p.split_y
+    return BoardDims(
+        cell=p.cell, board_t=p.board_t, rib_w=p.rib_w, rib_h=p.rib_h,
+        frame_w=p.frame_w, split_x=p.split_x, split_y=p.split_y,
+        cells_per_tile_x=grid // p.split_x, cells_per_tile_y=grid // p.split_y,
+        dowel_d=p.dowel_d, dowel_len=p.dowel_len, dowel_clear=p.dowel_clear,
+        solver=boolean_solver(p),
+    )
+
+
+def create_board_tile(tile_x, tile_y, d):
+    """Generate one board tile with base plate, grid ribs, and frame portion.
+
+    `d` is the BoardDims snapshot of the board parameters.
+    """
+    cell = d.cell
+    cells_per_tile_x = d.cells_per_tile_x
+    cells_per_tile_y = d.cells_per_tile_y
 
     # Cell range for this tile
     cx_start = tile_x * cells_per_tile_x
@@ -550,10 +723,10 @@ def create_board_tile(tile_x, tile_y, p):
     cy_end = cy_start + cells_per_tile_y
 
     # Frame extends only on outer edges
-    frame_left = p.frame_w if tile_x == 0 else 0
-    frame_right = p.frame_w if tile_x == p.split_x - 1 else 0
-    frame_bottom = p.frame_w if tile_y == 0 else 0
-    frame_top = p.frame_w if tile_y == p.split_y - 1 else 0
+    frame_left = d.frame_w if tile_x == 0 else 0
+    frame_right = d.frame_w if tile_x == d.split_x - 1 else 0
+    frame_bottom = d.frame_w if tile_y == 0 else 0
+    frame_top = d.frame_w if tile_y == d.split_y - 1 else 0
 
     # Tile physical bounds
     x_min = cx_start * cell - frame_left
@@ -563,22 +736,17 @@ def create_board_tile(tile_x, tile_y, p):
     tile_w = x_max - x_min
     tile_h = y_max - y_min
 
-    objs = []
+    # Parts as (location, scale) boxes and (location, radius, depth)
+    # cylinders. Boxes and posts go into one mesh; holes are subtracted.
+    boxes = []
+    posts = []
+    holes = []
 
     # Base plate
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(
-            (x_min + x_max) / 2,
-            (y_min + y_max) / 2,
-            -p.board_t / 2,
-        ),
-        scale=(tile_w, tile_h, p.board_t),
-    )
-    base = bpy.context.active_object
-    base.name = f"_base_{tile_x}_{tile_y}"
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-    objs.append(base)
+    boxes.append((
+        ((x_min + x_max) / 2, (y_min + y_max) / 2, -d.board_t / 2),
+        (tile_w, tile_h, d.board_t),
+    ))
 
     # Grid ribs (vertical: along X grid lines within this tile)
     # X grid lines: from cx_start to cx_end (inclusive = cells_per_tile_x + 1 lines)
@@ -587,85 +755,47 @@ def create_board_tile(tile_x, tile_y, p):
         # Rib spans the cell region (not the frame region)
         rib_y_min = cy_start * cell
         rib_y_max = cy_end * cell
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(
-                x_pos,
-                (rib_y_min + rib_y_max) / 2,
-                p.rib_h / 2,
-            ),
-            scale=(p.rib_w, rib_y_max - rib_y_min, p.rib_h),
-        )
-        rib = bpy.context.active_object
-        rib.name = f"_ribX_{gx}"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(rib)
+        boxes.append((
+            (x_pos, (rib_y_min + rib_y_max) / 2, d.rib_h / 2),
+            (d.rib_w, rib_y_max - rib_y_min, d.rib_h),
+        ))
 
     # Y grid lines (horizontal)
     for gy in range(cy_start, cy_end + 1):
         y_pos = gy * cell
         rib_x_min = cx_start * cell
         rib_x_max = cx_end * cell
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(
-                (rib_x_min + rib_x_max) / 2,
-                y_pos,
-                p.rib_h / 2,
-            ),
-            scale=(rib_x_max - rib_x_min, p.rib_w, p.rib_h),
-        )
-        rib = bpy.context.active_object
-        rib.name = f"_ribY_{gy}"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(rib)
+        boxes.append((
+            ((rib_x_min + rib_x_max) / 2, y_pos, d.rib_h / 2),
+            (rib_x_max - rib_x_min, d.rib_w, d.rib_h),
+        ))
 
     # Frame walls (raised edges on outer borders of the full board)
-    frame_h = p.rib_h + 1.5  # frame taller than ribs
+    frame_h = d.rib_h + 1.5  # frame taller than ribs
 
     if frame_left > 0:
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(x_min + frame_left / 2, (y_min + y_max) / 2, frame_h / 2),
-            scale=(frame_left, tile_h, frame_h),
-        )
-        fw = bpy.context.active_object
-        fw.name = "_frame_left"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(fw)
+        boxes.append((
+            (x_min + frame_left / 2, (y_min + y_max) / 2, frame_h / 2),
+            (frame_left, tile_h, frame_h),
+        ))
 
     if frame_right > 0:
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(x_max - frame_right / 2, (y_min + y_max) / 2, frame_h / 2),
-            scale=(frame_right, tile_h, frame_h),
-        )
-        fw = bpy.context.active_object
-        fw.name = "_frame_right"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(fw)
+        boxes.append((
+            (x_max - frame_right / 2, (y_min + y_max) / 2, frame_h / 2),
+            (frame_right, tile_h, frame_h),
+        ))
 
     if frame_bottom > 0:
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=((x_min + x_max) / 2, y_min + frame_bottom / 2, frame_h / 2),
-            scale=(tile_w, frame_bottom, frame_h),
-        )
-        fw = bpy.context.active_object
-        fw.name = "_frame_bottom"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(fw)
+        boxes.append((
+            ((x_min + x_max) / 2, y_min + frame_bottom / 2, frame_h / 2),
+            (tile_w, frame_bottom, frame_h),
+        ))
 
     if frame_top > 0:
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=((x_min + x_max) / 2, y_max - frame_top / 2, frame_h / 2),
-            scale=(tile_w, frame_top, frame_h),
-        )
-        fw = bpy.context.active_object
-        fw.name = "_frame_top"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(fw)
+        boxes.append((
+            ((x_min + x_max) / 2, y_max - frame_top / 2, frame_h / 2),
+            (tile_w, frame_top, frame_h),
+        ))
 
     # Anti-warp reinforcement ribs on underside
     reinforce_count = 3
@@ -681,213 +811,249 @@ def create_board_tile(tile_x, tile_y, p):
     for i in range(reinforce_count):
         frac = (i + 1) / (reinforce_count + 1)
         # Horizontal reinforcement
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(
-                (cell_x_min + cell_x_max) / 2,
-                cell_y_min + span_y * frac,
-                -p.board_t - reinforce_h / 2,
-            ),
-            scale=(span_x * 0.95, reinforce_w, reinforce_h),
-        )
-        rr = bpy.context.active_object
-        rr.name = f"_reinforce_h_{i}"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(rr)
-
+        boxes.append((
+            ((cell_x_min + cell_x_max) / 2, cell_y_min + span_y * frac,
+             -d.board_t - reinforce_h / 2),
+            (span_x * 0.95, reinforce_w, reinforce_h),
+        ))
         # Vertical reinforcement
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(
-                cell_x_min + span_x * frac,
-                (cell_y_min + cell_y_max) / 2,
-                -p.board_t - reinforce_h / 2,
-            ),
-            scale=(reinforce_w, span_y * 0.95, reinforce_h),
-        )
-        rr = bpy.context.active_object
-        rr.name = f"_reinforce_v_{i}"
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        objs.append(rr)
+        boxes.append((
+            (cell_x_min + span_x * frac, (cell_y_min + cell_y_max) / 2,
+             -d.board_t - reinforce_h / 2),
+            (reinforce_w, span_y * 0.95, reinforce_h),
+        ))
 
     # Dowel posts / holes at tile boundaries
     # Add dowel posts on right/top edges, holes on left/bottom edges
-    dowel_r = p.dowel_d / 2
-    dowel_r_hole = dowel_r + p.dowel_clear
-    half_len = p.dowel_len / 2
-
-    def add_cylinder(cx, cy, cz, radius, depth, cyl_name):
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=radius,
-            depth=depth,
-            location=(cx, cy, cz),
-            vertices=24,
-        )
-        c = bpy.context.active_object
-        c.name = cyl_name
-        return c
+    dowel_r = d.dowel_d / 2
+    dowel_r_hole = dowel_r + d.dowel_clear
+    half_len = d.dowel_len / 2
+    dowel_z = -d.board_t - half_len
 
     # Right edge dowels (posts on right tile, holes on left tile)
-    if tile_x < p.split_x - 1:
+    if tile_x < d.split_x - 1:
         edge_x = cx_end * cell
         mid_y = (cy_start + cy_end) * cell / 2
         spacing = (cy_end - cy_start) * cell / 3
-        for di, offset in enumerate([-spacing / 2, spacing / 2]):
-            post = add_cylinder(
-                edge_x, mid_y + offset,
-                -p.board_t - half_len,
-                dowel_r, p.dowel_len,
-                f"_dowel_post_r_{tile_x}_{tile_y}_{di}",
-            )
-            objs.append(post)
+        for offset in (-spacing / 2, spacing / 2):
+            posts.append(((edge_x, mid_y + offset, dowel_z), dowel_r, d.dowel_len))
 
     if tile_x > 0:
         edge_x = cx_start * cell
         mid_y = (cy_start + cy_end) * cell / 2
         spacing = (cy_end - cy_start) * cell / 3
-        for di, offset in enumerate([-spacing / 2, spacing / 2]):
-            hole = add_cylinder(
-                edge_x, mid_y + offset,
-                -p.board_t - half_len,
-                dowel_r_hole, p.dowel_len + 0.5,
-                f"_dowel_hole_l_{tile_x}_{tile_y}_{di}",
-            )
-            # Boolean subtract hole from base
-            # We need to do this after joining, so mark it
-            hole["_is_hole"] = True
-            objs.append(hole)
+        for offset in (-spacing / 2, spacing / 2):
+            holes.append(((edge_x, mid_y + offset, dowel_z),
+                          dowel_r_hole, d.dowel_len + 0.5))
 
     # Top edge dowels
-    if tile_y < p.split_y - 1:
+    if tile_y < d.split_y - 1:
         edge_y = cy_end * cell
         mid_x = (cx_start + cx_end) * cell / 2
         spacing = (cx_end - cx_start) * cell / 3
-        for di, offset in enumerate([-spacing / 2, spacing / 2]):
-            post = add_cylinder(
-                mid_x + offset, edge_y,
-                -p.board_t - half_len,
-                dowel_r, p.dowel_len,
-                f"_dowel_post_t_{tile_x}_{tile_y}_{di}",
-            )
-            objs.append(post)
+        for offset in (-spacing / 2, spacing / 2):
+            posts.append(((mid_x + offset, edge_y, dowel_z), dowel_r, d.dowel_len))
 
     if tile_y > 0:
         edge_y = cy_start * cell
         mid_x = (cx_start + cx_end) * cell / 2
         spacing = (cx_end - cx_start) * cell / 3
-        for di, offset in enumerate([-spacing / 2, spacing / 2]):
-            hole = add_cylinder(
-                mid_x + offset, edge_y,
-                -p.board_t - half_len,
-                dowel_r_hole, p.dowel_len + 0.5,
-                f"_dowel_hole_b_{tile_x}_{tile_y}_{di}",
-            )
-            hole["_is_hole"] = True
-            objs.append(hole)
-
-    # Separate holes from non-holes
-    holes = [o for o in objs if o.get("_is_hole")]
-    solids = [o for o in objs if not o.get("_is_hole")]
-
-    # Join solids
-    bpy.ops.object.select_all(action='DESELECT')
-    for o in solids:
-        o.select_set(True)
-    bpy.context.view_layer.objects.active = solids[0]
-    bpy.ops.object.join()
-    tile_obj = bpy.context.active_object
-    tile_obj.name = f"BLK_B_{tile_x}_{tile_y}"
-
-    # Subtract holes
-    for hole in holes:
-        apply_boolean(tile_obj, hole, 'DIFFERENCE')
-        if hole.name in bpy.data.objects:
-            bpy.data.objects.remove(hole, do_unlink=True)
+        for offset in (-spacing / 2, spacing / 2):
+            holes.append(((mid_x + offset, edge_y, dowel_z),
+                          dowel_r_hole, d.dowel_len + 0.5))
+
+    # All solids in one mesh
+    solids = ([box_geometry(loc, scale) for loc, scale in boxes]
+              + [cylinder_geometry(loc, radius, depth) for loc, radius, depth in posts])
+    tile_obj = new_mesh_object(f"BLK_B_{tile_x}_{tile_y}", merge_geometry(solids),
+                               "BLK_BOARD")
+
+    # Subtract holes: the cylinders are disjoint, so they can share one
+    # cutter mesh and a single DIFFERENCE
+    if holes:
+        cutter = new_mesh_object(
+            f"_dowel_holes_{tile_x}_{tile_y}",
+            merge_geometry([cylinder_geometry(loc, radius, depth)
+                            for loc, radius, depth in holes]),
+        )
+        apply_boolean(tile_obj, cutter, 'DIFFERENCE', d.solver)
+        remove_with_mesh(cutter)
 
     # Store params
     tile_obj["blk_cell"] = cell
     tile_obj["blk_tile_x"] = tile_x
     tile_obj["blk_tile_y"] = tile_y
 
-    link_to_collection(tile_obj, "BLK_BOARD")
     return tile_obj
 
 # ---------------------------------------------------------------------------
 # 6. Layout (shelf packing)
 # ---------------------------------------------------------------------------
 
-def layout_pieces_shelf(color, piece_objects, gap, cell):
-    """Arrange piece objects in a shelf layout, sorted by bounding-box area descending."""
-    if not piece_objects:
-        return
+def shelf_layout(metas, gap, cell):
+    """Shelf-pack piece cell bboxes; returns {name: (x, y)} object locations.
 
+    `metas` maps piece names to PieceMeta; pieces are placed by bounding-box
+    area, descending.
+    """
     # Sort by bounding box area (descending)
-    def bbox_area(obj):
-        bb = obj.bound_box
-        xs = [v[0] for v in bb]
-        ys = [v[1] for v in bb]
-        return (max(xs) - min(xs)) * (max(ys) - min(ys))
-
-    piece_objects.sort(key=bbox_area, reverse=True)
+    items = sorted(metas.items(),
+                   key=lambda item: item[1].bbox[0] * item[1].bbox[1],
+                   reverse=True)
 
     # Shelf packing
+    layout = {}
     cursor_x = 0.0
     cursor_y = 0.0
     row_height = 0.0
     max_row_width = cell * 25  # reasonable row width
 
-    for obj in piece_objects:
-        bb = obj.bound_box
-        xs = [v[0] for v in bb]
-        ys = [v[1] for v in bb]
-        w = max(xs) - min(xs)
-        h = max(ys) - min(ys)
-        ox = min(xs)
-        oy = min(ys)
-
+    for name, meta in items:
+        w = meta.bbox[0] * cell
+        h = meta.bbox[1] * cell
         if cursor_x + w > max_row_width and cursor_x > 0:
             cursor_x = 0.0
             cursor_y += row_height + gap
             row_height = 0.0
 
-        obj.location.x += (cursor_x - ox)
-        obj.location.y += (cursor_y - oy)
+        layout[name] = (cursor_x - meta.min_x * cell, cursor_y - meta.min_y * cell)
 
         cursor_x += w + gap
         row_height = max(row_height, h)
 
+    return layout
+
 
 # ---------------------------------------------------------------------------
 # 7. STL Export
 # ---------------------------------------------------------------------------
 
-def export_stl_objects(objects, filepath, apply_transforms):
-    """Export a list of objects to STL."""
-    dirpath = os.path.dirname(filepath)
-    os.makedirs(dirpath, exist_ok=True)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-
-    if apply_transforms:
-        for obj in objects:
-            select_only(obj)
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-        # Re-select all
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in objects:
-            obj.select_set(True)
-        bpy.context.view_layer.objects.active = objects[0]
-
-    bpy.ops.export_mesh.stl(filepath=filepath, use_selection=True)
+# One binary STL facet: normal, 3 vertices, attribute byte count
+STL_FACET_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("verts", "<f4", (9,)),
+    ("attr", "<u2"),
+])
+
+
+def object_triangles(obj, depsgraph):
+    """Return the evaluated world-space triangles of obj as an (n, 3, 3) float32 array."""
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    if mesh is None:
+        # No geometry (e.g. an Empty)
+        return np.empty((0, 3, 3), dtype=np.float32)
+    try:
+        mesh.calc_loop_triangles()
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        tri_verts = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tri_verts)
+    finally:
+        obj_eval.to_mesh_clear()
+
+    mat = np.array(obj.matrix_world, dtype=np.float32)
+    co = co.reshape(-1, 3) @ mat[:3, :3].T + mat[:3, 3]
+    return co[tri_verts].reshape(-1, 3, 3)
+
+
+def write_stl_binary(tris, filepath):
+    """Write an (n, 3, 3) triangle array as a binary STL file."""
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    lengths[lengths == 0.0] = 1.0  # degenerate faces keep a zero normal
+
+    facets = np.zeros(len(tris), dtype=STL_FACET_DTYPE)
+    facets["normal"] = normals / lengths
+    facets["verts"] = tris.reshape(-1, 9)
+
+    with open(filepath, "wb") as f:
+        f.write(b"Blokus Builder".ljust(80, b"\0"))
+        f.write(struct.pack("<I", len(facets)))
+        facets.tofile(f)
+
+
+def export_stl_objects(objects, filepath, executor=None):
+    """Export a list of objects to one binary STL file (directory must exist).
+
+    With an executor the file write is submitted to it and its Future is
+    returned; mesh data is always read on the calling thread.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    tris = np.concatenate([
+        object_triangles(obj, depsgraph) for obj in objects
+    ])
+    if executor is None:
+        write_stl_binary(tris, filepath)
+        return None
+    return executor.submit(write_stl_binary, tris, filepath)
 
 
 # ---------------------------------------------------------------------------
 # Operators
 # ---------------------------------------------------------------------------
 
+def report_errors(op, msgs):
+    for m in msgs:
+        op.report({'ERROR'}, m)
+
+
+def generate_board(op, p):
+    """Validate and (re)build the board tiles. Returns (ok, tile_count)."""
+    ok, msgs = validate_params(p)
+    if not ok:
+        report_errors(op, msgs)
+        return False, 0
+
+    ensure_scene_units_mm()
+    wipe_collections(("BLK_BOARD",))
+
+    dims = board_dims(p)
+    for tx in range(dims.split_x):
+        for ty in range(dims.split_y):
+            create_board_tile(tx, ty, dims)
+
+    return True, dims.split_x * dims.split_y
+
+
+def generate_pieces(op, p):
+    """Validate and (re)build all enabled colors' pieces. Returns (ok, piece_count)."""
+    ok_p, msgs_p = validate_pieces()
+    if not ok_p:
+        report_errors(op, msgs_p)
+        return False, 0
+    ok_v, msgs_v = validate_params(p)
+    if not ok_v:
+        report_errors(op, msgs_v)
+        return False, 0
+
+    ensure_scene_units_mm()
+
+    colors = enabled_colors(p)
+    piece_col_names = tuple(f"BLK_PIECES_{c}" for c in colors)
+    wipe_collections(piece_col_names + ("BLK_TMP",))
+    _PIECE_MESH_CACHE.clear()
+
+    # Same shelf slots for every color, shifted along Y per color
+    layout = shelf_layout(PIECE_META, p.layout_gap, p.cell)
+
+    total = 0
+    for ci, (color, col_name) in enumerate(zip(colors, piece_col_names)):
+        color_offset_y = ci * (p.cell * 12 + p.layout_gap * 5)
+        for piece_name, meta in PIECE_META.items():
+            x, y = layout[piece_name]
+            obj = create_piece_with_grooves(piece_name, meta, color, col_name, p,
+                                            (x, y + color_offset_y, 0.0))
+            if obj:
+                total += 1
+
+    if not p.keep_cutters:
+        wipe_collections(("BLK_TMP",))
+    _PIECE_MESH_CACHE.clear()
+
+    return True, total
+
+
 class BLK_OT_GenerateBoard(Operator):
     bl_idname = "blk.generate_board"
     bl_label = "Generate Board"
@@ -896,19 +1062,9 @@ class BLK_OT_GenerateBoard(Operator):
 
     def execute(self, context):
         p = context.scene.blk_params
-        ok, msgs = validate_params(p)
+        ok, _ = generate_board(self, p)
         if not ok:
-            for m in msgs:
-                self.report({'ERROR'}, m)
             return {'CANCELLED'}
-
-        ensure_scene_units_mm()
-        wipe_collection("BLK_BOARD")
-
-        for tx in range(p.split_x):
-            for ty in range(p.split_y):
-                create_board_tile(tx, ty, p)
-
         self.report({'INFO'}, f"Board generated: {p.split_x}x{p.split_y} tiles")
         return {'FINISHED'}
 
@@ -920,45 +1076,9 @@ class BLK_OT_GeneratePieces(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        p = context.scene.blk_params
-        ok_p, msgs_p = validate_pieces()
-        if not ok_p:
-            for m in msgs_p:
-                self.report({'ERROR'}, m)
-            return {'CANCELLED'}
-        ok_v, msgs_v = validate_params(p)
-        if not ok_v:
-            for m in msgs_v:
-                self.report({'ERROR'}, m)
+        ok, total = generate_pieces(self, context.scene.blk_params)
+        if not ok:
             return {'CANCELLED'}
-
-        ensure_scene_units_mm()
-
-        colors = enabled_colors(p)
-        for color in colors:
-            col_name = f"BLK_PIECES_{color}"
-            wipe_collection(col_name)
-
-        wipe_collection("BLK_TMP")
-
-        total = 0
-        for ci, color in enumerate(colors):
-            piece_objs = []
-            for piece_name, cells in PIECES.items():
-                obj = create_piece_with_grooves(piece_name, cells, color, p)
-                if obj:
-                    piece_objs.append(obj)
-                    total += 1
-
-            # Layout with Y offset per color
-            color_offset_y = ci * (p.cell * 12 + p.layout_gap * 5)
-            layout_pieces_shelf(color, piece_objs, p.layout_gap, p.cell)
-            for obj in piece_objs:
-                obj.location.y += color_offset_y
-
-        if not p.keep_cutters:
-            wipe_collection("BLK_TMP")
-
         self.report({'INFO'}, f"Generated {total} pieces")
         return {'FINISHED'}
 
@@ -971,10 +1091,16 @@ class BLK_OT_GenerateAll(Operator):
 
     def execute(self, context):
         p = context.scene.blk_params
+        tiles = pieces = 0
         if p.make_board:
-            bpy.ops.blk.generate_board()
+            ok, tiles = generate_board(self, p)
+            if not ok:
+                return {'CANCELLED'}
         if p.make_pieces:
-            bpy.ops.blk.generate_pieces()
+            ok, pieces = generate_pieces(self, p)
+            if not ok:
+                return {'CANCELLED'}
+        self.report({'INFO'}, f"Generated {tiles} board tiles and {pieces} pieces")
         return {'FINISHED'}
 
 
@@ -991,47 +1117,67 @@ class BLK_OT_ExportSTL(Operator):
             self.report({'ERROR'}, "Export directory not set")
             return {'CANCELLED'}
 
-        exported = 0
-
-        if p.export_mode == 'BOARD_TILES':
-            col_name = "BLK_BOARD"
-            if col_name in bpy.data.collections:
-                board_dir = os.path.join(base_dir, "board")
-                for obj in bpy.data.collections[col_name].objects:
-                    fpath = os.path.join(board_dir, f"{obj.name}.stl")
-                    export_stl_objects([obj], fpath, p.apply_transforms)
-                    exported += 1
-
-        elif p.export_mode == 'PER_PIECE':
-            for color in enabled_colors(p):
-                col_name = f"BLK_PIECES_{color}"
-                if col_name in bpy.data.collections:
-                    piece_dir = os.path.join(base_dir, "pieces", color.lower())
-                    for obj in bpy.data.collections[col_name].objects:
-                        fpath = os.path.join(piece_dir, f"{obj.name}.stl")
-                        export_stl_objects([obj], fpath, p.apply_transforms)
-                        exported += 1
-
-        elif p.export_mode == 'PER_COLOR':
-            for color in enabled_colors(p):
-                col_name = f"BLK_PIECES_{color}"
-                if col_name in bpy.data.collections:
-                    objs = list(bpy.data.collections[col_name].objects)
+        colors = enabled_colors(p)
+        export_mode = p.export_mode
+
+        sep = os.sep
+        board_dir = os.path.join(base_dir, "board")
+        pieces_dir = os.path.join(base_dir, "pieces")
+
+        piece_col_names = tuple(f"BLK_PIECES_{c}" for c in colors)
+        piece_dirs = tuple(f"{pieces_dir}{sep}{c.lower()}" for c in colors)
+        piece_color_files = tuple(f"{pieces_dir}{sep}{c.lower()}.stl" for c in colors)
+
+        def collection_objects(col_name):
+            col = bpy.data.collections.get(col_name)
+            return list(col.objects) if col is not None else []
+
+        board_objs = collection_objects("BLK_BOARD")
+        if export_mode in ('PER_PIECE', 'PER_COLOR'):
+            piece_objs = tuple(collection_objects(n) for n in piece_col_names)
+        else:
+            piece_objs = ()
+
+        # Only directories that will receive files
+        dirs_needed = set()
+        if board_objs:
+            dirs_needed.add(board_dir)
+        if export_mode == 'PER_PIECE':
+            dirs_needed.update(d for d, objs in zip(piece_dirs, piece_objs) if objs)
+        elif any(piece_objs):
+            dirs_needed.add(pieces_dir)
+        for d in dirs_needed:
+            os.makedirs(d, exist_ok=True)
+
+        # File writes run on a pool
+        writes = []
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+
+            def export(objs, fpath):
+                writes.append(export_stl_objects(objs, fpath, pool))
+
+            def export_board_tiles():
+                # One file per tile, in every export mode
+                for obj, name in zip(board_objs, [o.name for o in board_objs]):
+                    export([obj], f"{board_dir}{sep}{name}.stl")
+
+            if export_mode == 'PER_PIECE':
+                for objs, piece_dir in zip(piece_objs, piece_dirs):
+                    for obj, name in zip(objs, [o.name for o in objs]):
+                        export([obj], f"{piece_dir}{sep}{name}.stl")
+
+            elif export_mode == 'PER_COLOR':
+                for objs, fpath in zip(piece_objs, piece_color_files):
                     if objs:
-                        piece_dir = os.path.join(base_dir, "pieces")
-                        fpath = os.path.join(piece_dir, f"{color.lower()}.stl")
-                        export_stl_objects(objs, fpath, p.apply_transforms)
-                        exported += 1
-
-        # Also export board tiles if not in board-only mode
-        if p.export_mode in ('PER_PIECE', 'PER_COLOR'):
-            col_name = "BLK_BOARD"
-            if col_name in bpy.data.collections:
-                board_dir = os.path.join(base_dir, "board")
-                for obj in bpy.data.collections[col_name].objects:
-                    fpath = os.path.join(board_dir, f"{obj.name}.stl")
-                    export_stl_objects([obj], fpath, p.apply_transforms)
-                    exported += 1
+                        export(objs, fpath)
+
+            # BOARD_TILES exports only these; the piece modes include them too
+            export_board_tiles()
+
+            # Surface write errors (e.g. disk full) on the main thread
+            for future in as_completed(writes):
+                future.result()
+        exported = len(writes)
 
         self.report({'INFO'}, f"Exported {exported} STL files to {base_dir}")
         return {'FINISHED'}
@@ -1044,10 +1190,9 @@ class BLK_OT_Clean(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        wipe_collection("BLK_BOARD")
-        for color in COLORS:
-            wipe_collection(f"BLK_PIECES_{color}")
-        wipe_collection("BLK_TMP")
+        wipe_collections(["BLK_BOARD"]
+                         + [f"BLK_PIECES_{color}" for color in COLORS]
+                         + ["BLK_TMP"])
         self.report({'INFO'}, "Cleaned all Blokus objects")
         return {'FINISHED'}
 
@@ -1067,6 +1212,12 @@ class BLK_PT_MainPanel(Panel):
         layout = self.layout
         p = context.scene.blk_params
 
+        # Derived groove values
+        rib_w, clear, rib_h, piece_t = p.rib_w, p.clear, p.rib_h, p.piece_t
+        groove_w = rib_w + 2 * clear
+        groove_d = rib_h + 0.25
+        remaining = piece_t - groove_d
+
         # --- Dimensions ---
         box = layout.box()
         box.label(text="Cell & Clearance", icon='SNAP_GRID')
@@ -1088,11 +1239,8 @@ class BLK_PT_MainPanel(Panel):
         box.prop(p, "bevel_top")
         box.prop(p, "bevel_bottom")
         # Show computed groove values
-        groove_w = p.rib_w + 2 * p.clear
-        groove_d = p.rib_h + 0.25
         box.label(text=f"Groove W: {groove_w:.2f} mm")
         box.label(text=f"Groove D: {groove_d:.2f} mm")
-        remaining = p.piece_t - groove_d
         if remaining < 1.6:
             box.label(text=f"WARNING: remaining wall {remaining:.2f} mm", icon='ERROR')
 
@@ -1132,13 +1280,13 @@ class BLK_PT_MainPanel(Panel):
         box.label(text="Export", icon='EXPORT')
         box.prop(p, "export_dir")
         box.prop(p, "export_mode")
-        box.prop(p, "apply_transforms")
         box.operator("blk.export_stl", icon='FILE_BLANK')
 
         # --- Cleanup ---
         box = layout.box()
         box.label(text="Utilities", icon='TOOL_SETTINGS')
         box.prop(p, "keep_cutters")
+        box.prop(p, "fast_boolean")
         box.operator("blk.clean", icon='TRASH')
 
 